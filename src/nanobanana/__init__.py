@@ -1,7 +1,7 @@
 """Nanobanana - High-quality Gemini image generation library."""
 
 from .generator import generate_image
-from .batch import generate_batch
+from .batch import generate_batch, generate_batch_iter
 from .models.image import ImageConfig, ImageResult, AspectRatio
 from .models.profile import GenerationProfile
 from .client import GeminiImageClient
@@ -11,6 +11,7 @@ __version__ = "0.1.0"
 __all__ = [
     "generate_image",
     "generate_batch",
+    "generate_batch_iter",
     "ImageConfig",
     "ImageResult",
     "AspectRatio",
@@ -1,19 +1,44 @@
 """Batch image generation with adaptive rate limiting."""
 
 import asyncio
+import functools
 import logging
+import random
 from pathlib import Path
-from typing import Optional, Union
+from typing import AsyncIterator, Callable, Optional, Union
 from dataclasses import dataclass
 
+import httpx
+from google.genai import errors as genai_errors
+
 from .client import GeminiImageClient
 from .config import get_max_concurrent, get_rpm_limit
 from .models.image import ImageConfig, ImageResult
 from .models.profile import GenerationProfile, load_profile
 from .rate_limit import AdaptiveSemaphore, RPMLimiter
+from .timing import Timings, collecting, timed
 
 logger = logging.getLogger(__name__)
 
+# HTTP status codes worth retrying
+RATE_LIMIT_STATUS = 429
+TRANSIENT_STATUSES = frozenset({500, 502, 503, 504})
+
+# Network failures worth retrying (timeouts, connection resets, ...)
+TRANSIENT_ERRORS = (httpx.TransportError,)
+
+# Retry policy: attempts per item and capped exponential backoff (seconds)
+MAX_RETRIES = 5
+BASE_DELAY = 2
+MAX_DELAY = 30
+
+
+def _error_status(error: Exception) -> Optional[int]:
+    """Get the HTTP status code of a Gemini API error, if it is one."""
+    if isinstance(error, genai_errors.APIError):
+        return error.code
+    return None
+
 
 @dataclass
 class BatchItem:
@@ -41,6 +66,7 @@ async def generate_batch(
     rpm_limit: Optional[int] = None,
     skip_existing: bool = True,
     api_key: Optional[str] = None,
+    timings: Optional[Timings] = None,
 ) -> list[ImageResult]:
     """Generate multiple images with adaptive rate limiting.
 
@@ -58,9 +84,10 @@ async def generate_batch(
         rpm_limit: Requests per minute limit (default from env)
         skip_existing: Skip items where output file already exists
         api_key: Google API key (uses environment if not provided)
+        timings: Collector to fill with this run's per-phase timings
 
     Returns:
-        List of ImageResult for successful generations
+        List of ImageResult for successful generations, in input order
 
     Examples:
         >>> results = await generate_batch([
@@ -68,6 +95,60 @@ async def generate_batch(
         ...     {"prompt": "A blue wizard", "output": "wizard.png"},
         ... ], max_concurrent=10)
     """
+    indexed = [
+        entry async for entry in _iter_batch(
+            items, config, profile, max_concurrent, rpm_limit, skip_existing,
+            api_key, timings,
+        )
+    ]
+    indexed.sort(key=lambda entry: entry[0])
+    return [result for _, result in indexed]
+
+
+async def generate_batch_iter(
+    items: list[dict],
+    config: Optional[ImageConfig] = None,
+    profile: Optional[str] = None,
+    max_concurrent: Optional[int] = None,
+    rpm_limit: Optional[int] = None,
+    skip_existing: bool = True,
+    api_key: Optional[str] = None,
+    timings: Optional[Timings] = None,
+    on_start: Optional[Callable[[int], None]] = None,
+) -> AsyncIterator[ImageResult]:
+    """Generate multiple images, yielding each result as it completes.
+
+    Same behavior and arguments as generate_batch, but streams successful
+    results in completion order so callers can report progress.
+
+    Args:
+        on_start: Called once, before any work starts, with the number of
+            items that will be generated (after skipping existing outputs),
+            e.g. to size a progress bar
+
+    Examples:
+        >>> async for result in generate_batch_iter(items):
+        ...     print(f"Generated: {result.path}")
+    """
+    async for _, result in _iter_batch(
+        items, config, profile, max_concurrent, rpm_limit, skip_existing,
+        api_key, timings, on_start,
+    ):
+        yield result
+
+
+async def _iter_batch(
+    items: list[dict],
+    config: Optional[ImageConfig],
+    profile: Optional[str],
+    max_concurrent: Optional[int],
+    rpm_limit: Optional[int],
+    skip_existing: bool,
+    api_key: Optional[str],
+    timings: Optional[Timings],
+    on_start: Optional[Callable[[int], None]] = None,
+) -> AsyncIterator[tuple[int, ImageResult]]:
+    """Run a batch, yielding (item index, result) for each success."""
     # Load profile if specified
     gen_profile: Optional[GenerationProfile] = None
     if profile:
@@ -88,81 +169,87 @@ async def generate_batch(
 
     # Track stats
     stats = BatchStats(total=len(items))
-    results: list[ImageResult] = []
-    results_lock = asyncio.Lock()
+    if timings is None:
+        timings = Timings()
+
+    # Create client; its async connections are closed when the batch ends
+    client = GeminiImageClient(api_key=api_key, max_concurrent=concurrent)
 
-    # Create client
-    client = GeminiImageClient(api_key=api_key)
+    @timed("process_item")
+    async def process_item(item: dict) -> Optional[tuple[ImageResult, asyncio.Future]]:
+        """Process a single batch item with retry logic.
 
-    async def process_item(item: dict) -> Optional[ImageResult]:
-        """Process a single batch item with retry logic."""
+        Returns once the API responds; the file write continues in the
+        background and the returned future completes when it is done.
+        """
         prompt = item["prompt"]
         output_path = Path(item["output"])
         item_config = item.get("config", config)
 
-        # Skip if exists
-        if skip_existing and output_path.exists():
-            logger.info(f"Skipped (exists): {output_path}")
-            stats.skipped += 1
-            return None
-
         # Format prompt with profile
         if gen_profile:
             formatted_prompt = gen_profile.format_prompt(prompt)
         else:
             formatted_prompt = prompt
 
-        # Retry logic
-        max_retries = 5
-        base_delay = 2
+        def backoff(attempt: int) -> float:
+            """Capped exponential backoff with jitter to spread out retries."""
+            delay = min(BASE_DELAY * (2 ** attempt), MAX_DELAY)
+            return delay * (1 + random.random() * 0.5)
+
+        # A request rejected with 429 still counted against the upstream
+        # quota, so the local RPM token it consumed carries over to the retry
+        rpm_token_spent = False
 
-        for attempt in range(max_retries):
+        for attempt in range(MAX_RETRIES):
             try:
-                # Acquire rate limiting tokens
-                await semaphore.acquire()
-                await rate_limiter.acquire()
+                async with semaphore:
+                    if not rpm_token_spent:
+                        await rate_limiter.acquire()
+                    rpm_token_spent = False
 
-                try:
-                    result = await client.generate_async(
+                    result, saved = await client.generate_async_deferred(
                         formatted_prompt,
                         output_path,
                         item_config,
                     )
 
-                    stats.successful += 1
-                    await semaphore.report_success()
-
-                    logger.info(
-                        f"Generated: {output_path.name} "
-                        f"({result.width}x{result.height})"
-                    )
+                await semaphore.report_success()
 
-                    return result
+                logger.info(
+                    f"Generated: {output_path.name} "
+                    f"({result.width}x{result.height})"
+                )
 
-                finally:
-                    semaphore.release()
+                return result, saved
 
             except Exception as e:
-                error_str = str(e)
+                status = _error_status(e)
 
                 # Handle rate limiting
-                if "429" in error_str or "rate limit" in error_str.lower():
+                if status == RATE_LIMIT_STATUS:
                     stats.rate_limited += 1
+                    rpm_token_spent = True
                     await semaphore.report_rate_limit()
-                    delay = base_delay * (2 ** attempt)
+                    delay = backoff(attempt)
                     logger.warning(
                         f"Rate limited: {output_path.name}, "
-                        f"retry {attempt + 1}/{max_retries} in {delay}s"
+                        f"retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s"
                     )
                     await asyncio.sleep(delay)
                     continue
 
-                # Handle 503 (service overload)
-                elif "503" in error_str:
-                    delay = base_delay * (2 ** attempt)
+                # Handle transient server errors (500/502/503/504) and
+                # network failures such as read timeouts
+                elif status in TRANSIENT_STATUSES or isinstance(e, TRANSIENT_ERRORS):
+                    delay = backoff(attempt)
+                    reason = (
+                        f"Server error {status}" if status
+                        else f"Network error ({type(e).__name__})"
+                    )
                     logger.warning(
-                        f"Service overloaded: {output_path.name}, "
-                        f"retry {attempt + 1}/{max_retries} in {delay}s"
+                        f"{reason}: {output_path.name}, "
+                        f"retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s"
                     )
                     await asyncio.sleep(delay)
                     continue
@@ -174,16 +261,92 @@ async def generate_batch(
                     return None
 
         # Max retries exhausted
-        logger.error(f"Failed after {max_retries} attempts: {output_path.name}")
+        logger.error(f"Failed after {MAX_RETRIES} attempts: {output_path.name}")
         stats.failed += 1
         return None
 
-    # Process all items
-    tasks = [process_item(item) for item in items]
-    all_results = await asyncio.gather(*tasks)
-
-    # Collect successful results
-    results = [r for r in all_results if r is not None]
+    # Drop items whose output already exists before scheduling any work.
+    # A later item writing to the same path as an earlier one would find
+    # it existing once the earlier item finished, so skip it up front too.
+    if skip_existing:
+        pending = []
+        seen_outputs: set[Path] = set()
+        for index, item in enumerate(items):
+            output_path = Path(item["output"])
+            if output_path in seen_outputs or output_path.exists():
+                continue
+            seen_outputs.add(output_path)
+            pending.append((index, item))
+    else:
+        pending = list(enumerate(items))
+    stats.skipped = len(items) - len(pending)
+    if stats.skipped:
+        logger.info(f"Skipped {stats.skipped} items with existing or duplicate outputs")
+    if on_start:
+        on_start(len(pending))
+
+    # Process items with a fixed pool of workers pulling from a queue, so
+    # memory scales with concurrency rather than batch size
+    queue: asyncio.Queue[tuple[int, dict]] = asyncio.Queue()
+    for entry in pending:
+        queue.put_nowait(entry)
+
+    # Successful results in completion order; None marks the end
+    done: asyncio.Queue[Optional[tuple[int, ImageResult]]] = asyncio.Queue()
+
+    # File writes still in progress. Workers move on to their next request
+    # while a write runs, hiding save time behind API latency.
+    pending_saves: set[asyncio.Future] = set()
+
+    def on_saved(index: int, result: ImageResult, saved: asyncio.Future) -> None:
+        """Publish a result once its file is written."""
+        pending_saves.discard(saved)
+        if saved.cancelled():
+            return
+        if error := saved.exception():
+            logger.error(f"Failed to save: {result.path.name} - {error}")
+            stats.failed += 1
+            return
+        stats.successful += 1
+        done.put_nowait((index, result))
+
+    async def worker() -> None:
+        """Process queued items until the queue is drained."""
+        while True:
+            try:
+                index, item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            outcome = await process_item(item)
+            if outcome is not None:
+                result, saved = outcome
+                pending_saves.add(saved)
+                saved.add_done_callback(functools.partial(on_saved, index, result))
+
+    async def run_workers() -> None:
+        # Timers in this task and the workers it spawns record into this
+        # batch's collector only
+        try:
+            with collecting(timings):
+                await asyncio.gather(
+                    *(worker() for _ in range(min(concurrent, len(pending))))
+                )
+                await asyncio.gather(*pending_saves, return_exceptions=True)
+        finally:
+            done.put_nowait(None)
+
+    runner = asyncio.create_task(run_workers())
+    try:
+        while (entry := await done.get()) is not None:
+            yield entry
+        await runner
+    finally:
+        # Stop outstanding work if the consumer exits early
+        if not runner.done():
+            runner.cancel()
+            await asyncio.wait([runner])
+        # Async connections belong to this event loop; don't leave them pooled
+        await client.aclose()
 
     # Log summary
     logger.info(
@@ -191,8 +354,8 @@ async def generate_batch(
         f"{stats.skipped} skipped, {stats.failed} failed, "
         f"{stats.rate_limited} rate limited"
     )
-
-    return results
+    if summary := timings.format():
+        logger.info(f"Batch timings: {summary}")
 
 
 def run_batch(
@@ -0,0 +1,118 @@
+"""On-disk cache of generated images keyed by prompt and config.
+
+Lets re-runs reuse an image generated earlier for the same formatted
+prompt, model, and aspect ratio, even when it is requested at a
+different output path. Only single-image generation (generate_image)
+uses the cache; batches always call the API.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional
+
+from .client import PNG_SIGNATURE, _image_size
+from .config import get_cache_dir
+from .models.image import ImageConfig, ImageResult
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(prompt: str, config: ImageConfig) -> str:
+    """Hash the inputs that determine a generated image."""
+    parts = [prompt, config.model, config.get_aspect_ratio_string()]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+# Extensions for the formats Gemini may return, most common first
+_EXTENSIONS = (".png", ".jpg", ".webp", ".gif", ".img")
+
+
+def _image_extension(header: bytes) -> str:
+    """Pick a file extension from an image's leading bytes."""
+    if header.startswith(PNG_SIGNATURE):
+        return ".png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    if header.startswith(b"GIF8"):
+        return ".gif"
+    return ".img"
+
+
+def _cache_path(key: str, extension: str) -> Path:
+    return get_cache_dir() / f"{key}{extension}"
+
+
+def _find_cached(key: str) -> Optional[Path]:
+    """Find the cache entry for a key, whatever its image format."""
+    for extension in _EXTENSIONS:
+        path = _cache_path(key, extension)
+        if path.exists():
+            return path
+    return None
+
+
+def _copy_atomic(src: Path, dst: Path) -> None:
+    """Atomically place a copy of src at dst.
+
+    Always copies rather than hardlinks: a shared inode would let an
+    in-place edit of one output rewrite the cache entry and every other
+    output restored from it.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dst.with_suffix(dst.suffix + ".part")
+    try:
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def load_cached(
+    prompt: str,
+    config: ImageConfig,
+    output_path: Path,
+) -> Optional[ImageResult]:
+    """Copy a cached image to output_path if one exists.
+
+    Returns:
+        ImageResult for the restored image, or None on a cache miss
+
+    Raises:
+        OSError: If the cache entry exists but cannot be read or copied
+    """
+    start_time = time.time()
+    cached = _find_cached(cache_key(prompt, config))
+    if cached is None:
+        return None
+
+    _copy_atomic(cached, output_path)
+    width, height = _image_size(output_path.read_bytes())
+    logger.info(f"Cache hit: {output_path.name}")
+
+    return ImageResult(
+        path=output_path,
+        width=width,
+        height=height,
+        prompt=prompt,
+        generation_time=time.time() - start_time,
+        model=config.model,
+        aspect_ratio=config.get_aspect_ratio_string(),
+    )
+
+
+def store_cached(prompt: str, config: ImageConfig, image_path: Path) -> None:
+    """Add a generated image to the cache, named for its actual format.
+
+    Images are saved exactly as the API returned them, which need not be
+    PNG, so the entry's extension comes from the file's leading bytes.
+    """
+    with open(image_path, "rb") as f:
+        extension = _image_extension(f.read(12))
+    _copy_atomic(image_path, _cache_path(cache_key(prompt, config), extension))
@@ -5,16 +5,23 @@ import json
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of large prompt files
+    orjson = None
+
 import click
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
 from .config import ensure_output_dir, ensure_profiles_dir, PROFILES_DIR
 from .generator import generate_image
-from .batch import generate_batch
+from .batch import generate_batch_iter
 from .models.image import AspectRatio
 from .models.profile import load_profile, list_profiles, GenerationProfile
+from .timing import Timings
 
 console = Console()
 
@@ -119,8 +126,8 @@ def batch(
         gemini-image batch prompts.json -o ./images/ --concurrent 12
     """
     # Load prompts
-    with open(prompts_file, "r") as f:
-        prompts = json.load(f)
+    with open(prompts_file, "rb") as f:
+        prompts = orjson.loads(f.read()) if orjson else json.load(f)
 
     if not isinstance(prompts, list):
         console.print("[red]Error: JSON file must contain an array of objects[/red]")
@@ -164,22 +171,75 @@ def batch(
         console.print(f"[dim]Profile: {profile}[/dim]")
     console.print()
 
-    # Run batch
-    try:
-        results = asyncio.run(
-            generate_batch(
+    timings = Timings()
+
+    # Items the batch will actually generate, as reported when it starts
+    pending = len(items)
+
+    async def run() -> int:
+        """Run the batch, printing each image as it completes."""
+        generated = 0
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[cyan]{task.description}"),
+            TextColumn("{task.completed}/{task.total}"),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Generating", total=None)
+
+            def on_start(count: int) -> None:
+                """Size the bar to the items that will actually run."""
+                nonlocal pending
+                pending = count
+                progress.update(task, total=count)
+                if count < len(items):
+                    progress.console.print(f"[dim]Skipping existing: {len(items) - count}[/dim]")
+
+            async for result in generate_batch_iter(
                 items=items,
                 profile=profile,
                 max_concurrent=concurrent,
                 rpm_limit=rpm,
                 skip_existing=skip_existing,
-            )
-        )
-        console.print(f"\n[green]Completed: {len(results)}/{len(items)} images generated[/green]")
+                timings=timings,
+                on_start=on_start,
+            ):
+                generated += 1
+                progress.advance(task)
+                progress.console.print(f"[dim]Generated: {result.path}[/dim]")
+        return generated
+
+    # Run batch
+    try:
+        generated = asyncio.run(run())
+        console.print(f"\n[green]Completed: {generated}/{pending} images generated[/green]")
+        if generated < pending:
+            console.print(f"[yellow]Failed: {pending - generated} (see log for details)[/yellow]")
+        print_timings(timings)
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
 
 
+def print_timings(timings: Timings):
+    """Print per-phase timings from a batch as a table."""
+    phases = timings.snapshot()
+    if not phases:
+        return
+
+    table = Table(title="Phase Timings")
+    table.add_column("Phase", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right", style="bold")
+    table.add_column("Average", justify="right", style="dim")
+
+    for phase, (count, total_ns) in phases.items():
+        total_s = total_ns / 1e9
+        table.add_row(phase, str(count), f"{total_s:.2f}s", f"{total_s / count:.3f}s")
+
+    console.print(table)
+
+
 @cli.command()
 def profiles():
     """List available generation profiles."""
@@ -1,39 +1,245 @@
 """Gemini API client wrapper for image generation."""
 
 import asyncio
+import contextvars
+import functools
+import io
 import logging
+import os
+import struct
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+import httpx
 from google import genai
 from google.genai import types
 from PIL import Image
 
-from .config import get_api_key, get_default_model
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from .config import get_api_key, get_default_model, get_max_concurrent
 from .models.image import ImageConfig, ImageResult
+from .timing import timer
 
 logger = logging.getLogger(__name__)
 
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Worker threads for async image saves and header reads. These are short
+# local-disk jobs, so a few threads keep up with any request concurrency.
+SAVE_WORKERS = 4
+
+
+def _png_size(data: bytes) -> Optional[tuple[int, int]]:
+    """Get (width, height) from a PNG's IHDR chunk, or None if not a PNG."""
+    if data[:8] == PNG_SIGNATURE and data[12:16] == b"IHDR":
+        return struct.unpack(">II", data[16:24])
+    return None
+
+
+def _image_size(data: bytes) -> tuple[int, int]:
+    """Get (width, height) of encoded image bytes.
+
+    PNGs are read straight from the IHDR chunk; other formats fall back
+    to PIL, which only parses the header.
+    """
+    size = _png_size(data)
+    if size is not None:
+        return size
+    with Image.open(io.BytesIO(data)) as pil_img:
+        return pil_img.size
+
+
+def _http_options(max_concurrent: int) -> types.HttpOptions:
+    """Build httpx settings for the SDK's sync and async HTTP clients.
+
+    Keeps one idle connection per concurrent request alive long enough to
+    survive retry backoff, and uses HTTP/2 when the ``h2`` package is
+    installed. The total connection count is left unbounded: callers
+    already cap requests in flight, and a tighter pool limit would only
+    turn bursts into pool timeouts.
+
+    Args:
+        max_concurrent: Expected number of requests in flight
+    """
+    client_args = {
+        "http2": HTTP2_AVAILABLE,
+        "limits": httpx.Limits(
+            max_connections=None,
+            max_keepalive_connections=max_concurrent,
+            keepalive_expiry=30.0,
+        ),
+    }
+    return types.HttpOptions(
+        client_args=client_args,
+        async_client_args=dict(client_args),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_shared_client(api_key: str) -> genai.Client:
+    """Get a genai.Client shared by every GeminiImageClient using this key.
+
+    Reusing the SDK client keeps its HTTP connection pool warm instead of
+    paying connection setup on every generation. Only its sync API is
+    used: pooled async connections are bound to the event loop that
+    opened them, so they cannot be shared process-wide.
+    """
+    return genai.Client(
+        api_key=api_key, http_options=_http_options(get_max_concurrent())
+    )
+
+
 class GeminiImageClient:
-    """Client for Gemini image generation API."""
+    """Client for Gemini image generation API.
+
+    Sync calls use a genai.Client shared per API key. Async calls use a
+    client owned by this instance, whose connections belong to the event
+    loop that first used it; call ``aclose()`` (or use ``async with``)
+    before that loop ends.
+    """
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Shared across instances so async saves reuse warm worker threads
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
+    ):
         """Initialize the client.
 
         Args:
             api_key: Google API key. If not provided, reads from environment.
+            max_concurrent: Async requests expected in flight, used to size
+                the connection pool (default from env)
         """
         self._api_key = api_key or get_api_key()
-        self._client: Optional[genai.Client] = None
+        self._max_concurrent = max_concurrent or get_max_concurrent()
+        self._async_client: Optional[genai.Client] = None
 
     @property
     def client(self) -> genai.Client:
-        """Get or create the Gemini client."""
-        if self._client is None:
-            self._client = genai.Client(api_key=self._api_key)
-        return self._client
+        """Get the shared Gemini client for this API key."""
+        return _get_shared_client(self._api_key)
+
+    @property
+    def aio(self) -> genai.client.AsyncClient:
+        """Get this instance's async Gemini client, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = genai.Client(
+                api_key=self._api_key,
+                http_options=_http_options(self._max_concurrent),
+            )
+        return self._async_client.aio
+
+    async def aclose(self) -> None:
+        """Close this instance's async HTTP connections.
+
+        A new async client is created lazily on the next async call.
+        """
+        if self._async_client is not None:
+            client, self._async_client = self._async_client, None
+            await client.aio.aclose()
+
+    async def __aenter__(self):
+        """Context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit. Closes async connections."""
+        await self.aclose()
+        return False
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get or create the shared worker pool for async image saves.
+
+        The pool is process-wide and fixed at SAVE_WORKERS threads, so it
+        does not depend on which batch happened to create it. Idle threads
+        cost nothing between batches; they are joined at interpreter exit,
+        or earlier via ``shutdown_executor()``.
+        """
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=SAVE_WORKERS,
+                thread_name_prefix="nanobanana",
+            )
+        return cls._executor
+
+    @classmethod
+    def shutdown_executor(cls, wait: bool = True) -> None:
+        """Shut down the shared worker pool.
+
+        A new pool is created lazily on the next async save.
+        """
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=wait)
+            cls._executor = None
+
+    def _build_config(self, config: ImageConfig) -> types.GenerateContentConfig:
+        """Build the SDK generation config from an ImageConfig."""
+        return types.GenerateContentConfig(
+            response_modalities=config.response_modalities,
+            image_config=types.ImageConfig(
+                aspect_ratio=config.get_aspect_ratio_string()
+            )
+        )
+
+    def _extract_image(self, response: types.GenerateContentResponse) -> bytes:
+        """Get the encoded bytes of the first image in a response."""
+        for part in response.parts:
+            blob = part.inline_data
+            if blob and blob.data and blob.mime_type and blob.mime_type.startswith("image/"):
+                return blob.data
+
+        raise RuntimeError("No image in response from Gemini API")
+
+    def _write_image(self, data: bytes, output_path: Path) -> None:
+        """Write encoded image bytes as-is to output_path.
+
+        Writes to a temp file and renames, so an interrupted save never
+        leaves a truncated image for skip_existing to trust.
+        """
+        # Ensure parent directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = output_path.with_suffix(output_path.suffix + ".part")
+        try:
+            with timer("image_save"):
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _make_result(
+        self,
+        size: tuple[int, int],
+        prompt: str,
+        output_path: Path,
+        config: ImageConfig,
+        start_time: float,
+    ) -> ImageResult:
+        """Describe a generated image of the given (width, height)."""
+        width, height = size
+
+        return ImageResult(
+            path=output_path,
+            width=width,
+            height=height,
+            prompt=prompt,
+            generation_time=time.time() - start_time,
+            model=config.model,
+            aspect_ratio=config.get_aspect_ratio_string(),
+        )
 
     def generate(
         self,
@@ -54,46 +260,19 @@ class GeminiImageClient:
         config = config or ImageConfig()
         start_time = time.time()
 
-        # Build generation config
-        gen_config = types.GenerateContentConfig(
-            response_modalities=config.response_modalities,
-            image_config=types.ImageConfig(
-                aspect_ratio=config.get_aspect_ratio_string()
+        with timer("gemini_api"):
+            response = self.client.models.generate_content(
+                model=config.model,
+                contents=prompt,
+                config=self._build_config(config)
             )
-        )
 
-        # Generate
-        response = self.client.models.generate_content(
-            model=config.model,
-            contents=prompt,
-            config=gen_config
+        data = self._extract_image(response)
+        self._write_image(data, output_path)
+        return self._make_result(
+            _image_size(data), prompt, output_path, config, start_time
         )
 
-        # Extract and save image
-        for part in response.parts:
-            if image := part.as_image():
-                # Ensure parent directory exists
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                image.save(str(output_path))
-
-                # Get image dimensions
-                pil_img = Image.open(str(output_path))
-                width, height = pil_img.size
-
-                generation_time = time.time() - start_time
-
-                return ImageResult(
-                    path=output_path,
-                    width=width,
-                    height=height,
-                    prompt=prompt,
-                    generation_time=generation_time,
-                    model=config.model,
-                    aspect_ratio=config.get_aspect_ratio_string(),
-                )
-
-        raise RuntimeError("No image in response from Gemini API")
-
     async def generate_async(
         self,
         prompt: str,
@@ -102,8 +281,8 @@ class GeminiImageClient:
     ) -> ImageResult:
         """Generate a single image asynchronously.
 
-        Runs the synchronous generation in a thread pool to avoid
-        blocking the event loop.
+        Awaits the SDK's native async API, so the request itself never
+        occupies a thread. Only the file write runs in the shared pool.
 
         Args:
             prompt: The text prompt for image generation
@@ -113,9 +292,59 @@ class GeminiImageClient:
         Returns:
             ImageResult with details about the generated image
         """
-        return await asyncio.to_thread(
-            self.generate,
-            prompt,
+        result, saved = await self.generate_async_deferred(prompt, output_path, config)
+        await saved
+        return result
+
+    async def generate_async_deferred(
+        self,
+        prompt: str,
+        output_path: Path,
+        config: Optional[ImageConfig] = None,
+    ) -> tuple[ImageResult, asyncio.Future]:
+        """Generate a single image and write it to disk in the background.
+
+        Returns as soon as the API responds, so callers can overlap the
+        file write with their next request.
+
+        Args:
+            prompt: The text prompt for image generation
+            output_path: Path to save the generated image
+            config: Image configuration (uses defaults if not provided)
+
+        Returns:
+            Tuple of the ImageResult and a future that completes once
+            output_path is written (and raises if the write failed)
+        """
+        config = config or ImageConfig()
+        start_time = time.time()
+
+        with timer("gemini_api"):
+            response = await self.aio.models.generate_content(
+                model=config.model,
+                contents=prompt,
+                config=self._build_config(config)
+            )
+
+        data = self._extract_image(response)
+        loop = asyncio.get_running_loop()
+
+        # Only the PNG header read is cheap enough for the event loop;
+        # anything else goes through PIL in the worker pool
+        size = _png_size(data)
+        if size is None:
+            size = await loop.run_in_executor(
+                self._get_executor(), _image_size, data
+            )
+        result = self._make_result(size, prompt, output_path, config, start_time)
+
+        # Run the write in a copy of this context so its timer is recorded
+        # into the caller's active Timings
+        saved = loop.run_in_executor(
+            self._get_executor(),
+            contextvars.copy_context().run,
+            self._write_image,
+            data,
             output_path,
-            config,
         )
+        return result, saved
@@ -1,5 +1,6 @@
 """Configuration management for nanobanana."""
 
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -22,8 +23,13 @@ def get_api_key() -> str:
     return key
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_model() -> str:
-    """Get the default Gemini model for image generation."""
+    """Get the default Gemini model for image generation.
+
+    Read once per process; call ``get_default_model.cache_clear()`` after
+    changing GEMINI_MODEL at runtime.
+    """
     return os.getenv("GEMINI_MODEL", "gemini-3-pro-image-preview")
 
 
@@ -37,6 +43,22 @@ def get_rpm_limit() -> int:
     return int(os.getenv("RPM_LIMIT", "50"))
 
 
+def get_cache_enabled() -> bool:
+    """Whether generate_image reuses cached images for repeated inputs."""
+    return os.getenv("NANOBANANA_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for cached generated images."""
+    default = Path.home() / ".cache" / "nanobanana"
+    return Path(os.getenv("NANOBANANA_CACHE_DIR", default))
+
+
+def get_profile_cache_enabled() -> bool:
+    """Whether parsed profiles are cached as JSON in the profiles .cache directory."""
+    return os.getenv("NANOBANANA_PROFILE_CACHE", "").lower() in ("1", "true", "yes")
+
+
 # Available models for image generation
 MODELS = {
     "flash": "gemini-2.0-flash-exp-image-generation",
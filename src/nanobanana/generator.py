@@ -1,12 +1,36 @@
 """Single image generation functions."""
 
+import functools
+import logging
 from pathlib import Path
 from typing import Optional, Union
 
+from .cache import load_cached, store_cached
 from .client import GeminiImageClient
-from .config import get_default_model
+from .config import get_cache_enabled, get_default_model
 from .models.image import ImageConfig, ImageResult, AspectRatio
-from .models.profile import GenerationProfile, load_profile
+from .models.profile import load_profile
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: Optional[str]) -> GeminiImageClient:
+    """Get a client reused across calls with the same API key.
+
+    ``api_key=None`` reuses the client built from the environment key.
+    Call ``_get_client.cache_clear()`` after changing the environment.
+    """
+    return GeminiImageClient(api_key=api_key)
+
+
+def _as_path(output: Union[Path, str]) -> Path:
+    """Get output as a Path, passing Path objects through unchanged.
+
+    Path(path) would rebuild the object (and drop any Path subclass); the
+    isinstance check costs a fraction of that and keeps the caller's object.
+    """
+    return output if isinstance(output, Path) else Path(output)
 
 
 def generate_image(
@@ -27,7 +51,8 @@ def generate_image(
         aspect_ratio: Aspect ratio (e.g., "2:3", "16:9", "1:1")
         model: Gemini model ID (uses default if not provided)
         profile: Profile ID to load settings from
-        api_key: Google API key (uses environment if not provided)
+        api_key: Google API key (uses environment if not provided). Clients
+            are reused across calls with the same key.
 
     Returns:
         ImageResult with details about the generated image
@@ -40,29 +65,72 @@ def generate_image(
         ... )
         >>> print(f"Generated: {result.path} ({result.width}x{result.height})")
     """
-    output_path = Path(output)
-
-    # Load profile if specified
-    gen_profile: Optional[GenerationProfile] = None
-    if profile:
-        gen_profile = load_profile(profile)
-
-    # Build config
-    if gen_profile:
-        config = gen_profile.config
-        # Apply profile's style to prompt
-        formatted_prompt = gen_profile.format_prompt(prompt)
-    else:
-        config = ImageConfig(
-            model=model or get_default_model(),
-            aspect_ratio=AspectRatio.from_string(aspect_ratio),
-        )
-        formatted_prompt = prompt
-
-    # Override model if explicitly specified
+    if not profile:
+        return _generate_no_profile(prompt, output, aspect_ratio, model, api_key)
+    return _generate_with_profile(prompt, output, profile, model, api_key)
+
+
+def _generate_no_profile(
+    prompt: str,
+    output: Union[Path, str],
+    aspect_ratio: str,
+    model: Optional[str],
+    api_key: Optional[str],
+) -> ImageResult:
+    """Generate from the call arguments alone (the common case)."""
+    # Both fields are already normalised, so skip Pydantic validation
+    config = ImageConfig.model_construct(
+        model=model or get_default_model(),
+        aspect_ratio=AspectRatio.from_string(aspect_ratio),
+    )
+    return _generate(prompt, _as_path(output), config, api_key)
+
+
+def _generate_with_profile(
+    prompt: str,
+    output: Union[Path, str],
+    profile: str,
+    model: Optional[str],
+    api_key: Optional[str],
+) -> ImageResult:
+    """Generate using a profile's config and prompt style."""
+    gen_profile = load_profile(profile)
+
+    # An explicit model overrides the profile's
+    config = gen_profile.config
     if model:
         config = config.model_copy(update={"model": model})
 
+    # Apply profile's style to prompt
+    formatted_prompt = gen_profile.format_prompt(prompt)
+
+    return _generate(formatted_prompt, _as_path(output), config, api_key)
+
+
+def _generate(
+    prompt: str,
+    output_path: Path,
+    config: ImageConfig,
+    api_key: Optional[str],
+) -> ImageResult:
+    """Generate a fully formatted prompt, going through the image cache."""
+    # Reuse a cached image for identical inputs (opt-in via NANOBANANA_CACHE)
+    use_cache = get_cache_enabled()
+    if use_cache:
+        try:
+            if cached := load_cached(prompt, config, output_path):
+                return cached
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable cache entry for {output_path.name}: {e}")
+
     # Generate
-    client = GeminiImageClient(api_key=api_key)
-    return client.generate(formatted_prompt, output_path, config)
+    client = _get_client(api_key)
+    result = client.generate(prompt, output_path, config)
+
+    if use_cache:
+        try:
+            store_cached(prompt, config, result.path)
+        except OSError as e:
+            logger.warning(f"Could not cache {result.path.name}: {e}")
+
+    return result
@@ -3,7 +3,7 @@
 from enum import Enum
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class AspectRatio(str, Enum):
@@ -19,24 +19,37 @@ class AspectRatio(str, Enum):
     def from_string(cls, value: str) -> "AspectRatio":
         """Convert a string aspect ratio to enum.
 
-        Accepts both enum names (PORTRAIT) and values (2:3).
+        Accepts both enum names (PORTRAIT, case-insensitive) and values
+        (2:3), resolved through a prebuilt alias table.
         """
-        # Try direct value match
-        for ratio in cls:
-            if ratio.value == value:
-                return ratio
-        # Try name match
-        try:
-            return cls[value.upper()]
-        except KeyError:
+        ratio = _ALIASES.get(value)
+        if ratio is None:
+            ratio = _ALIASES.get(value.upper())
+        if ratio is None:
             raise ValueError(
                 f"Invalid aspect ratio: {value}. "
                 f"Valid options: {[r.value for r in cls]}"
             )
+        return ratio
+
+
+# Every accepted spelling of each aspect ratio: value, name, lowercase name
+_ALIASES: dict[str, AspectRatio] = {
+    **{r.value: r for r in AspectRatio},
+    **{r.name: r for r in AspectRatio},
+    **{r.name.lower(): r for r in AspectRatio},
+}
 
 
 class ImageConfig(BaseModel):
-    """Configuration for image generation."""
+    """Configuration for image generation.
+
+    Frozen, and so hashable, because one config is shared by every item
+    in a batch. Aspect ratios may be given as enum names or values, and
+    unknown keys are ignored.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     model: str = Field(
         default="gemini-3-pro-image-preview",
@@ -46,11 +59,19 @@ class ImageConfig(BaseModel):
         default=AspectRatio.PORTRAIT,
         description="Aspect ratio for generated images"
     )
-    response_modalities: list[str] = Field(
-        default_factory=lambda: ["Image"],
+    response_modalities: tuple[str, ...] = Field(
+        default=("Image",),
         description="Response modalities (should include 'Image')"
     )
 
+    @field_validator("aspect_ratio", mode="before")
+    @classmethod
+    def _coerce_aspect_ratio(cls, value):
+        """Accept enum names (PORTRAIT) as well as values (2:3)."""
+        if isinstance(value, str) and not isinstance(value, AspectRatio):
+            return AspectRatio.from_string(value)
+        return value
+
     def get_aspect_ratio_string(self) -> str:
         """Get the aspect ratio as a string value."""
         return self.aspect_ratio.value
@@ -59,6 +80,8 @@ class ImageConfig(BaseModel):
 class ImageResult(BaseModel):
     """Result of an image generation."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
     path: Path = Field(description="Path to the generated image file")
     width: int = Field(description="Image width in pixels")
     height: int = Field(description="Image height in pixels")
@@ -66,6 +89,3 @@ class ImageResult(BaseModel):
     generation_time: float = Field(description="Time taken to generate in seconds")
     model: str = Field(description="Model used for generation")
     aspect_ratio: str = Field(description="Aspect ratio used")
-
-    class Config:
-        arbitrary_types_allowed = True
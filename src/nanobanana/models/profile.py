@@ -1,11 +1,22 @@
 """Generation profile data models using Pydantic."""
 
+import logging
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 import yaml
 from pydantic import BaseModel, Field
 
-from .image import ImageConfig, AspectRatio
+# Prefer libyaml's C implementation when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
+from .image import ImageConfig
+
+logger = logging.getLogger(__name__)
 
 
 class GenerationProfile(BaseModel):
@@ -31,60 +42,191 @@ class GenerationProfile(BaseModel):
 
     def format_prompt(self, prompt: str) -> str:
         """Format a prompt with the profile's style prefix and suffix."""
-        parts = []
-        if self.style_prefix:
-            parts.append(self.style_prefix)
-        parts.append(prompt)
-        if self.style_suffix:
-            parts.append(self.style_suffix)
-        return " ".join(parts)
+        if self.style_prefix and self.style_suffix:
+            return f"{self.style_prefix} {prompt} {self.style_suffix}"
+        elif self.style_prefix:
+            return f"{self.style_prefix} {prompt}"
+        elif self.style_suffix:
+            return f"{prompt} {self.style_suffix}"
+        return prompt
 
     @classmethod
     def from_yaml(cls, path: Path) -> "GenerationProfile":
         """Load a profile from a YAML file."""
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
-
-        # Handle nested config
-        if "config" in data:
-            config_data = data["config"]
-            # Convert aspect_ratio string to enum if present
-            if "aspect_ratio" in config_data:
-                config_data["aspect_ratio"] = AspectRatio.from_string(
-                    config_data["aspect_ratio"]
-                )
-            data["config"] = ImageConfig(**config_data)
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
 
         return cls(**data)
 
     def to_yaml(self, path: Path) -> None:
         """Save the profile to a YAML file."""
-        data = self.model_dump()
-        # Convert enums to strings for YAML
-        if "config" in data and "aspect_ratio" in data["config"]:
-            data["config"]["aspect_ratio"] = data["config"]["aspect_ratio"].value if hasattr(data["config"]["aspect_ratio"], "value") else str(data["config"]["aspect_ratio"])
+        # JSON mode emits enum values and plain lists, which safe dumpers accept
+        data = self.model_dump(mode="json")
 
         with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+
+
+@dataclass
+class _ProfileEntry:
+    """A profile file in an index, with its parse cached by mtime."""
+    path: str
+    mtime_ns: Optional[int] = None
+    profile: Optional[GenerationProfile] = None
+
+
+@dataclass
+class _ProfileIndex:
+    """In-memory view of one profiles directory.
+
+    The directory is rescanned when its mtime changes, or when a lookup
+    misses (mtimes can be too coarse to show a just-added file). Profiles
+    are parsed lazily on first load, then kept until their file changes.
+    """
+    dir_mtime_ns: Optional[int] = None
+    entries: dict[str, _ProfileEntry] = field(default_factory=dict)
+
+    def refresh(self, search_dir: Path, force: bool = False) -> None:
+        """Rescan the directory if it changed since the last scan, or if forced.
+
+        A ``.yaml`` file wins over a ``.yml`` with the same ID.
+        """
+        dir_stat = _stat_or_none(search_dir)
+        if dir_stat is None:
+            self.dir_mtime_ns = None
+            self.entries = {}
+            return
+        if dir_stat.st_mtime_ns == self.dir_mtime_ns and not force:
+            return
+
+        paths: dict[str, str] = {}
+        with os.scandir(search_dir) as dir_entries:
+            for entry in dir_entries:
+                if entry.name.endswith(".yaml"):
+                    paths[entry.name[:-5]] = entry.path
+                elif entry.name.endswith(".yml"):
+                    paths.setdefault(entry.name[:-4], entry.path)
+
+        # Keep already-parsed profiles whose path is unchanged
+        old = self.entries
+        self.entries = {
+            profile_id: (
+                old[profile_id]
+                if profile_id in old and old[profile_id].path == path
+                else _ProfileEntry(path)
+            )
+            for profile_id, path in paths.items()
+        }
+        self.dir_mtime_ns = dir_stat.st_mtime_ns
+
+    def load(self, profile_id: str, search_dir: Path) -> GenerationProfile:
+        """Get a parsed profile, re-parsing only if its file changed."""
+        from ..config import get_profile_cache_enabled
+
+        entry = self.entries.get(profile_id)
+        file_stat = _stat_or_none(entry.path) if entry else None
+        if file_stat is None:
+            self.refresh(search_dir, force=True)
+            entry = self.entries.get(profile_id)
+            file_stat = _stat_or_none(entry.path) if entry else None
+        if file_stat is None:
+            raise FileNotFoundError(f"Profile '{profile_id}' not found in {search_dir}")
+
+        if entry.profile is None or entry.mtime_ns != file_stat.st_mtime_ns:
+            path = Path(entry.path)
+            if get_profile_cache_enabled():
+                entry.profile = _load_profile_sidecar(path, file_stat.st_mtime_ns)
+            else:
+                entry.profile = GenerationProfile.from_yaml(path)
+            entry.mtime_ns = file_stat.st_mtime_ns
+        return entry.profile
+
+
+_indexes: dict[str, _ProfileIndex] = {}
+
+
+def _profile_index(search_dir: Path) -> _ProfileIndex:
+    """Get the up-to-date index for a directory."""
+    index = _indexes.setdefault(str(search_dir), _ProfileIndex())
+    index.refresh(search_dir)
+    return index
+
+
+def _stat_or_none(path) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it does not exist.
+
+    Lets one syscall serve as both the existence check and the source of
+    the mtime used in cache keys.
+    """
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+# Subdirectory of a profiles directory holding JSON sidecars. Keeping them
+# out of the profiles directory itself means writing one doesn't change
+# that directory's mtime and force a rescan.
+SIDECAR_DIR = ".cache"
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Get the JSON sidecar path for a profile file."""
+    return path.parent / SIDECAR_DIR / (path.name + ".json")
+
+
+def _load_profile_sidecar(path: Path, mtime_ns: int) -> GenerationProfile:
+    """Load a profile via a ``.json`` sidecar, rebuilding it when stale.
+
+    Sidecars live in the profiles directory's ``.cache`` subdirectory. A
+    sidecar is fresh when it is at least as new as the YAML file. It
+    is parsed and validated by pydantic-core, skipping YAML entirely, and
+    anything that no longer validates is rebuilt. Unreadable or
+    unwritable sidecars fall back to parsing the YAML.
+    """
+    cache_path = _sidecar_path(path)
+    cache_stat = _stat_or_none(cache_path)
+    if cache_stat is not None and cache_stat.st_mtime_ns >= mtime_ns:
+        try:
+            return GenerationProfile.model_validate_json(cache_path.read_bytes())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable profile cache {cache_path.name}: {e}")
+
+    profile = GenerationProfile.from_yaml(path)
+
+    tmp_path = cache_path.with_suffix(cache_path.suffix + ".part")
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        tmp_path.write_text(profile.model_dump_json())
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning(f"Could not write profile cache {cache_path.name}: {e}")
+
+    return profile
 
 
 def load_profile(profile_id: str, profiles_dir: Optional[Path] = None) -> GenerationProfile:
-    """Load a profile by ID from the profiles directory."""
+    """Load a profile by ID from the profiles directory.
+
+    Parsed profiles are cached until their file's mtime changes. Each
+    call returns its own copy, so callers may modify it freely.
+    """
     from ..config import PROFILES_DIR
 
     search_dir = profiles_dir or PROFILES_DIR
 
-    # Try with .yaml extension
-    yaml_path = search_dir / f"{profile_id}.yaml"
-    if yaml_path.exists():
-        return GenerationProfile.from_yaml(yaml_path)
+    # Shallow is enough: the only nested model, ImageConfig, is frozen
+    return _profile_index(search_dir).load(profile_id, search_dir).model_copy()
+
 
-    # Try with .yml extension
-    yml_path = search_dir / f"{profile_id}.yml"
-    if yml_path.exists():
-        return GenerationProfile.from_yaml(yml_path)
+def clear_profile_cache() -> None:
+    """Drop all cached profile indexes and parsed profiles."""
+    _indexes.clear()
 
-    raise FileNotFoundError(f"Profile '{profile_id}' not found in {search_dir}")
+
+# lru_cache-style entry point, e.g. for tests or after changing PROFILES_DIR
+load_profile.cache_clear = clear_profile_cache
 
 
 def list_profiles(profiles_dir: Optional[Path] = None) -> list[str]:
@@ -93,14 +235,4 @@ def list_profiles(profiles_dir: Optional[Path] = None) -> list[str]:
 
     search_dir = profiles_dir or PROFILES_DIR
 
-    if not search_dir.exists():
-        return []
-
-    profiles = []
-    for path in search_dir.glob("*.yaml"):
-        profiles.append(path.stem)
-    for path in search_dir.glob("*.yml"):
-        if path.stem not in profiles:
-            profiles.append(path.stem)
-
-    return sorted(profiles)
+    return sorted(_profile_index(search_dir).entries)
@@ -6,6 +6,7 @@ Battle-tested rate limiting from everpeak-comic project.
 import asyncio
 import logging
 import time
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,12 @@ class AdaptiveSemaphore:
     Automatically adjusts concurrency:
     - Decreases when hitting 429 errors
     - Increases when requests succeed consistently
+
+    Tracks in-flight requests against a concurrency cap and hands free
+    slots to a FIFO of waiter futures, rather than adding/removing permits
+    on an ``asyncio.Semaphore``. Resizing is O(1), never strands waiters,
+    and releasing is synchronous, so a slot cannot be lost to a
+    cancellation while waiting for a lock.
     """
 
     def __init__(
@@ -24,21 +31,51 @@ class AdaptiveSemaphore:
         min_value: int = 2,
         max_value: int = 20
     ):
-        self.value = initial_value
         self.min_value = min_value
         self.max_value = max_value
-        self._semaphore = asyncio.Semaphore(initial_value)
-        self._lock = asyncio.Lock()
         self._current_permits = initial_value
+        self._in_flight = 0
         self._success_count = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def value(self) -> int:
+        """Current concurrency cap."""
+        return self._current_permits
+
+    def _wake(self):
+        """Grant free slots to waiters in arrival order."""
+        while self._waiters and self._in_flight < self._current_permits:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
 
     async def acquire(self):
-        """Acquire a permit."""
-        await self._semaphore.acquire()
+        """Acquire a permit. Blocks while in-flight requests are at the cap."""
+        if not self._waiters and self._in_flight < self._current_permits:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted a slot just as we were cancelled; pass it on
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
 
     def release(self):
-        """Release a permit."""
-        self._semaphore.release()
+        """Release a permit, handing it straight to the next waiter."""
+        self._in_flight -= 1
+        self._wake()
 
     async def __aenter__(self):
         """Context manager entry."""
@@ -50,29 +87,31 @@ class AdaptiveSemaphore:
         self.release()
         return False
 
+    def _grow(self):
+        """Raise the cap by one (up to max_value) and hand out the new slot.
+
+        Synchronous, so callers can run it inside a larger atomic update.
+        """
+        if self._current_permits < self.max_value:
+            old = self._current_permits
+            self._current_permits += 1
+            self._wake()
+            logger.info(f"Increased concurrency: {old} -> {self._current_permits}")
+
     async def increase_concurrency(self):
         """Increase concurrency when things are going well."""
-        async with self._lock:
-            if self._current_permits < self.max_value:
-                old = self._current_permits
-                self._current_permits = min(self._current_permits + 1, self.max_value)
-                # Add a new permit
-                self._semaphore.release()
-                logger.info(f"Increased concurrency: {old} -> {self._current_permits}")
+        self._grow()
 
     async def decrease_concurrency(self):
-        """Decrease concurrency when hitting rate limits."""
-        async with self._lock:
-            if self._current_permits > self.min_value:
-                old = self._current_permits
-                self._current_permits = max(self._current_permits - 2, self.min_value)
-                # Remove permits by acquiring without releasing
-                try:
-                    for _ in range(min(2, old - self._current_permits)):
-                        self._semaphore.acquire_nowait()
-                except Exception:
-                    pass
-                logger.warning(f"Decreased concurrency: {old} -> {self._current_permits}")
+        """Decrease concurrency when hitting rate limits.
+
+        Only lowers the cap; requests already in flight drain naturally
+        and no new ones start until the in-flight count is below it.
+        """
+        if self._current_permits > self.min_value:
+            old = self._current_permits
+            self._current_permits = max(self._current_permits - 2, self.min_value)
+            logger.warning(f"Decreased concurrency: {old} -> {self._current_permits}")
 
     def get_current(self) -> int:
         """Get current concurrency level."""
@@ -80,11 +119,10 @@ class AdaptiveSemaphore:
 
     async def report_success(self):
         """Report a successful request. May increase concurrency."""
-        async with self._lock:
-            self._success_count += 1
-            # Increase concurrency every 10 successes
-            if self._success_count % 10 == 0:
-                await self.increase_concurrency()
+        self._success_count += 1
+        # Increase concurrency every 10 successes
+        if self._success_count % 10 == 0:
+            self._grow()
 
     async def report_rate_limit(self):
         """Report a rate limit error. Decreases concurrency."""
@@ -96,41 +134,50 @@ class RPMLimiter:
     """Token bucket rate limiter for requests per minute.
 
     Ensures we don't exceed the API's requests-per-minute limit
-    by using a token bucket algorithm.
+    by using a token bucket algorithm. When the bucket is empty, callers
+    reserve the next token (letting the balance go negative) and sleep
+    until it has refilled, so waiters never hold a lock or poll.
     """
 
     def __init__(self, max_per_minute: int = 50):
         self.max_per_minute = max_per_minute
-        self.capacity = float(max_per_minute)
-        self.last_update = time.time()
-        self.lock = asyncio.Lock()
+        self._rate = max_per_minute / 60.0  # tokens per second
+        self._tokens = float(max_per_minute)
+        self._last = time.monotonic()
+
+    @property
+    def capacity(self) -> float:
+        """Tokens left as of the last refill; 0 while callers are queued."""
+        return max(0.0, self._tokens)
+
+    @property
+    def last_update(self) -> float:
+        """``time.monotonic()`` timestamp of the last refill."""
+        return self._last
+
+    def _refill(self):
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._last) * self._rate,
+            self.max_per_minute
+        )
+        self._last = now
 
     async def acquire(self):
         """Acquire permission to make a request. Blocks if rate limited."""
-        async with self.lock:
-            now = time.time()
-            elapsed = now - self.last_update
-
-            # Refill capacity based on time elapsed
-            self.capacity = min(
-                self.capacity + (self.max_per_minute * elapsed / 60.0),
-                self.max_per_minute
-            )
-            self.last_update = now
-
-            # Wait if no capacity
-            while self.capacity < 1.0:
-                await asyncio.sleep(0.1)
-                now = time.time()
-                elapsed = now - self.last_update
-                self.capacity = min(
-                    self.capacity + (self.max_per_minute * elapsed / 60.0),
-                    self.max_per_minute
-                )
-                self.last_update = now
-
-            # Consume one token
-            self.capacity -= 1.0
+        # Refill and reserve a token atomically (no await in between);
+        # a negative balance is the backlog of reserved future tokens
+        self._refill()
+        self._tokens -= 1.0
+
+        if self._tokens < 0:
+            try:
+                await asyncio.sleep(-self._tokens / self._rate)
+            except asyncio.CancelledError:
+                # Hand back the reservation so later callers don't wait for it
+                self._tokens += 1.0
+                raise
 
     async def __aenter__(self):
         """Context manager entry."""
@@ -142,10 +189,6 @@ class RPMLimiter:
         return False
 
     def get_available(self) -> float:
-        """Get the current available capacity."""
-        now = time.time()
-        elapsed = now - self.last_update
-        return min(
-            self.capacity + (self.max_per_minute * elapsed / 60.0),
-            self.max_per_minute
-        )
+        """Get the current available capacity (0 while callers are queued)."""
+        elapsed = time.monotonic() - self._last
+        return max(0.0, min(self._tokens + elapsed * self._rate, self.max_per_minute))
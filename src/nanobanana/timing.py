@@ -0,0 +1,95 @@
+"""Lightweight per-phase timing for generation hot spots.
+
+Accumulates call counts and total wall time per named phase so a batch
+can report where its time went (API latency, image save, orchestration).
+Timers record into the Timings collector made active by ``collecting()``
+for the current context, so concurrent batches keep separate numbers and
+code outside any batch pays only a context-variable lookup.
+"""
+
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+
+class Timings:
+    """Call counts and total wall time per phase for one run."""
+
+    def __init__(self) -> None:
+        # phase -> [count, total_ns]; updated from worker threads, so lock-guarded
+        self._phases: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, phase: str, elapsed_ns: int) -> None:
+        """Add one timed call to a phase."""
+        with self._lock:
+            entry = self._phases.setdefault(phase, [0, 0])
+            entry[0] += 1
+            entry[1] += elapsed_ns
+
+    def snapshot(self) -> dict[str, tuple[int, int]]:
+        """Get a snapshot of (count, total_ns) per phase."""
+        with self._lock:
+            return {phase: (count, total) for phase, (count, total) in self._phases.items()}
+
+    def format(self) -> str:
+        """Format timings as a compact one-line summary for logs."""
+        parts = []
+        for phase, (count, total_ns) in self.snapshot().items():
+            total_s = total_ns / 1e9
+            parts.append(f"{phase}: {count}x {total_s:.2f}s (avg {total_s / count:.3f}s)")
+        return ", ".join(parts)
+
+
+_active: contextvars.ContextVar[Optional[Timings]] = contextvars.ContextVar(
+    "nanobanana_timings", default=None
+)
+
+
+@contextmanager
+def collecting(timings: Timings) -> Iterator[Timings]:
+    """Record timers run in the current context (and tasks it spawns) into timings."""
+    token = _active.set(timings)
+    try:
+        yield timings
+    finally:
+        _active.reset(token)
+
+
+@contextmanager
+def timer(phase: str) -> Iterator[None]:
+    """Time the enclosed block under the given phase, if collecting."""
+    timings = _active.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timings.record(phase, time.perf_counter_ns() - start)
+
+
+def timed(phase: str) -> Callable:
+    """Decorator that times every call of a sync or async function."""
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with timer(phase):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(phase):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,111 @@
+"""Local fake Gemini API server shared by the tests."""
+
+import base64
+import io
+import json
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+from PIL import Image
+
+from nanobanana import client as client_module
+from nanobanana import generator
+
+
+def image_response(fmt: str = "PNG", mime_type: str = "image/png") -> bytes:
+    """Build a generateContent response body holding a small 8x12 image."""
+    buf = io.BytesIO()
+    Image.new("RGB", (8, 12)).save(buf, fmt)
+    part = {
+        "inlineData": {
+            "mimeType": mime_type,
+            "data": base64.b64encode(buf.getvalue()).decode("ascii"),
+        }
+    }
+    return json.dumps(
+        {"candidates": [{"content": {"role": "model", "parts": [part]}}]}
+    ).encode("utf-8")
+
+
+class _FakeGeminiHandler(BaseHTTPRequestHandler):
+    """Answers requests with an image, keeping connections alive.
+
+    The server's ``script`` is a list of canned outcomes consumed one per
+    request: an HTTP status code to fail with, or "drop" to close the
+    connection without answering. Once it is empty, every request
+    succeeds with the server's ``body``. Prompts are logged to the
+    server's ``prompts`` list.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        with self.server.lock:
+            self.server.prompts.append(request["contents"][0]["parts"][0]["text"])
+            outcome = self.server.script.pop(0) if self.server.script else 200
+
+        if outcome == "drop":
+            self.close_connection = True
+            return
+        if outcome != 200:
+            error = json.dumps({"error": {"code": outcome, "message": "scripted", "status": "ERROR"}})
+            self._reply(outcome, error.encode("utf-8"))
+            return
+        self._reply(200, self.server.body)
+
+    def _reply(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeGeminiTestCase(unittest.TestCase):
+    """Points every GeminiImageClient at a local fake Gemini server."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGeminiHandler)
+        self.server.lock = threading.Lock()
+        self.server.prompts = []
+        self.server.script = []
+        self.server.body = image_response()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        http_options = client_module._http_options
+
+        def local_http_options(*args, **kwargs):
+            options = http_options(*args, **kwargs)
+            options.base_url = base_url
+            return options
+
+        patcher = mock.patch.object(client_module, "_http_options", local_http_options)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Sync clients are cached per API key; don't reuse one bound to
+        # another test's server
+        for cached in (client_module._get_shared_client, generator._get_client):
+            cached.cache_clear()
+            self.addCleanup(cached.cache_clear)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.out = Path(tmp.name)
+
+    def items(self, count: int, prefix: str = "item") -> list[dict]:
+        return [
+            {"prompt": f"{prefix} {i}", "output": self.out / f"{prefix}-{i}.png"}
+            for i in range(count)
+        ]
@@ -0,0 +1,177 @@
+"""Regression tests for batch generation against a local fake Gemini API.
+
+Run with: python -m unittest discover tests
+"""
+
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+from fake_gemini import FakeGeminiTestCase, image_response
+from nanobanana import batch
+from nanobanana import client as client_module
+from nanobanana.batch import generate_batch_iter, run_batch
+from nanobanana.rate_limit import RPMLimiter
+
+
+class RunBatchTest(FakeGeminiTestCase):
+    def test_consecutive_batches_in_one_process(self):
+        """Each run_batch gets its own event loop; connections must not leak across."""
+        for run in range(2):
+            items = self.items(2, prefix=f"run{run}")
+            results = run_batch(items, api_key="test-key")
+            self.assertEqual(len(results), 2, f"run {run} lost items")
+            for item in items:
+                self.assertTrue(item["output"].exists())
+
+    def test_non_png_size_is_read_off_the_event_loop(self):
+        self.server.body = image_response("JPEG", "image/jpeg")
+        threads = []
+        image_size = client_module._image_size
+
+        def recording_image_size(data):
+            threads.append(threading.current_thread().name)
+            return image_size(data)
+
+        with mock.patch.object(client_module, "_image_size", recording_image_size):
+            results = run_batch(self.items(1), api_key="test-key")
+
+        self.assertEqual((results[0].width, results[0].height), (8, 12))
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("nanobanana"), threads)
+
+
+class SkipExistingTest(FakeGeminiTestCase):
+    def test_skips_existing_outputs(self):
+        items = self.items(3)
+        items[1]["output"].write_bytes(b"existing")
+
+        results = run_batch(items, api_key="test-key")
+
+        self.assertEqual([r.path for r in results], [items[0]["output"], items[2]["output"]])
+        self.assertEqual(sorted(self.server.prompts), ["item 0", "item 2"])
+        self.assertEqual(items[1]["output"].read_bytes(), b"existing")
+
+    def test_duplicate_outputs_generate_once(self):
+        items = self.items(2)
+        items[1]["output"] = items[0]["output"]
+
+        results = run_batch(items, api_key="test-key")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(self.server.prompts, ["item 0"])
+
+    def test_no_skip_regenerates_everything(self):
+        items = self.items(2)
+        items[0]["output"].write_bytes(b"existing")
+
+        results = run_batch(items, skip_existing=False, api_key="test-key")
+
+        self.assertEqual(len(results), 2)
+        self.assertNotEqual(items[0]["output"].read_bytes(), b"existing")
+
+
+class RetryTest(FakeGeminiTestCase):
+    def setUp(self):
+        super().setUp()
+        for name, value in (("BASE_DELAY", 0), ("MAX_RETRIES", 3)):
+            patcher = mock.patch.object(batch, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # Count local RPM tokens taken
+        self.rpm_acquires = 0
+        acquire = RPMLimiter.acquire
+
+        async def counting_acquire(limiter):
+            self.rpm_acquires += 1
+            await acquire(limiter)
+
+        patcher = mock.patch.object(RPMLimiter, "acquire", counting_acquire)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_retried(self, outcome):
+        self.server.prompts.clear()
+        self.server.script = [outcome]
+
+        results = run_batch(self.items(1, prefix=f"retry{outcome}"), api_key="test-key")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(self.server.prompts, [f"retry{outcome} 0"] * 2)
+
+    def test_retries_rate_limit(self):
+        self.assert_retried(429)
+
+    def test_retries_server_errors(self):
+        for status in sorted(batch.TRANSIENT_STATUSES):
+            with self.subTest(status=status):
+                self.assert_retried(status)
+
+    def test_retries_network_errors(self):
+        self.assert_retried("drop")
+
+    def test_client_errors_are_not_retried(self):
+        self.server.script = [400]
+
+        results = run_batch(self.items(1), api_key="test-key")
+
+        self.assertEqual(results, [])
+        self.assertEqual(self.server.prompts, ["item 0"])
+
+    def test_gives_up_after_max_retries(self):
+        self.server.script = [503] * batch.MAX_RETRIES
+
+        results = run_batch(self.items(1), api_key="test-key")
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(self.server.prompts), batch.MAX_RETRIES)
+
+    def test_rate_limited_request_keeps_its_rpm_token(self):
+        self.server.script = [429]
+
+        run_batch(self.items(1), api_key="test-key")
+
+        self.assertEqual(len(self.server.prompts), 2)
+        self.assertEqual(self.rpm_acquires, 1)
+
+    def test_server_error_retry_takes_a_new_rpm_token(self):
+        self.server.script = [503]
+
+        run_batch(self.items(1), api_key="test-key")
+
+        self.assertEqual(len(self.server.prompts), 2)
+        self.assertEqual(self.rpm_acquires, 2)
+
+
+class WorkerQueueTest(FakeGeminiTestCase):
+    def test_drains_queue_with_fewer_workers_than_items(self):
+        items = self.items(25)
+
+        results = run_batch(items, max_concurrent=3, rpm_limit=1000, api_key="test-key")
+
+        self.assertEqual([r.path for r in results], [item["output"] for item in items])
+        self.assertEqual(len(self.server.prompts), 25)
+
+    def test_early_exit_stops_remaining_work(self):
+        items = self.items(50)
+
+        async def take_first():
+            async for result in generate_batch_iter(
+                items, max_concurrent=2, rpm_limit=1000, api_key="test-key"
+            ):
+                return result
+
+        first = asyncio.run(take_first())
+        sent = len(self.server.prompts)
+        threading.Event().wait(0.2)
+
+        self.assertTrue(first.path.exists())
+        self.assertLess(sent, len(items))
+        self.assertEqual(len(self.server.prompts), sent)
+        self.assertEqual(list(self.out.glob("*.part")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Tests for the opt-in image cache used by generate_image."""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from fake_gemini import FakeGeminiTestCase, image_response
+from nanobanana import generator
+from nanobanana.generator import generate_image
+
+
+class ImageCacheTest(FakeGeminiTestCase):
+    def setUp(self):
+        super().setUp()
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_dir = Path(cache_dir.name)
+        env = mock.patch.dict(os.environ, {
+            "NANOBANANA_CACHE": "1",
+            "NANOBANANA_CACHE_DIR": str(self.cache_dir),
+        })
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_miss_then_hit(self):
+        first = generate_image("a fox", self.out / "first.png", api_key="test-key")
+        second = generate_image("a fox", self.out / "second.png", api_key="test-key")
+
+        self.assertEqual(self.server.prompts, ["a fox"])
+        self.assertEqual(second.path.read_bytes(), first.path.read_bytes())
+        self.assertEqual((second.width, second.height), (8, 12))
+
+    def test_different_inputs_miss(self):
+        generate_image("a fox", self.out / "a.png", api_key="test-key")
+        generate_image("a fox", self.out / "b.png", aspect_ratio="16:9", api_key="test-key")
+        generate_image("a hen", self.out / "c.png", api_key="test-key")
+
+        self.assertEqual(len(self.server.prompts), 3)
+
+    def test_outputs_do_not_share_storage_with_the_cache(self):
+        first = generate_image("a fox", self.out / "first.png", api_key="test-key")
+        second = generate_image("a fox", self.out / "second.png", api_key="test-key")
+        first.path.write_bytes(b"edited in place")
+
+        self.assertEqual(os.stat(second.path).st_nlink, 1)
+        self.assertNotEqual(second.path.read_bytes(), b"edited in place")
+        third = generate_image("a fox", self.out / "third.png", api_key="test-key")
+        self.assertNotEqual(third.path.read_bytes(), b"edited in place")
+
+    def test_entries_are_named_for_their_format(self):
+        self.server.body = image_response("JPEG", "image/jpeg")
+
+        generate_image("a fox", self.out / "fox.png", api_key="test-key")
+        restored = generate_image("a fox", self.out / "again.png", api_key="test-key")
+
+        self.assertEqual([p.suffix for p in self.cache_dir.iterdir()], [".jpg"])
+        self.assertEqual(len(self.server.prompts), 1)
+        self.assertEqual((restored.width, restored.height), (8, 12))
+
+    def test_unreadable_entry_is_treated_as_a_miss(self):
+        generate_image("a fox", self.out / "first.png", api_key="test-key")
+
+        with mock.patch.object(generator, "load_cached", side_effect=OSError("denied")):
+            with self.assertLogs("nanobanana.generator", "WARNING"):
+                result = generate_image("a fox", self.out / "second.png", api_key="test-key")
+
+        self.assertTrue(result.path.exists())
+        self.assertEqual(len(self.server.prompts), 2)
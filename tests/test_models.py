@@ -0,0 +1,80 @@
+"""Tests for the image and profile data models."""
+
+import unittest
+
+from pydantic import ValidationError
+
+from nanobanana.models.image import AspectRatio, ImageConfig
+from nanobanana.models.profile import GenerationProfile
+
+
+class AspectRatioTest(unittest.TestCase):
+    def test_from_string_aliases(self):
+        for alias in ("16:9", "WIDE", "wide", "Wide"):
+            with self.subTest(alias=alias):
+                self.assertIs(AspectRatio.from_string(alias), AspectRatio.WIDE)
+
+    def test_from_string_rejects_unknown(self):
+        for bad in ("4:5", "", "16x9"):
+            with self.subTest(bad=bad), self.assertRaises(ValueError):
+                AspectRatio.from_string(bad)
+
+
+class ImageConfigTest(unittest.TestCase):
+    def test_defaults(self):
+        config = ImageConfig()
+        self.assertEqual(config.model, "gemini-3-pro-image-preview")
+        self.assertIs(config.aspect_ratio, AspectRatio.PORTRAIT)
+        self.assertEqual(config.response_modalities, ("Image",))
+
+    def test_coerces_aspect_ratio_names_and_values(self):
+        self.assertIs(ImageConfig(aspect_ratio="16:9").aspect_ratio, AspectRatio.WIDE)
+        self.assertIs(ImageConfig(aspect_ratio="wide").aspect_ratio, AspectRatio.WIDE)
+        self.assertIs(ImageConfig(aspect_ratio=AspectRatio.TALL).aspect_ratio, AspectRatio.TALL)
+
+    def test_coerces_modality_lists_to_tuples(self):
+        config = ImageConfig(response_modalities=["Image", "Text"])
+        self.assertEqual(config.response_modalities, ("Image", "Text"))
+
+    def test_rejects_invalid_fields(self):
+        for bad in ({"model": 123}, {"response_modalities": "Image"}, {"aspect_ratio": "4:5"}):
+            with self.subTest(bad=bad), self.assertRaises(ValidationError):
+                ImageConfig(**bad)
+
+    def test_ignores_unknown_keys(self):
+        self.assertEqual(ImageConfig(image_size="2K"), ImageConfig())
+        self.assertEqual(ImageConfig.model_validate({"image_size": "2K"}), ImageConfig())
+
+    def test_frozen_and_hashable(self):
+        config = ImageConfig()
+        with self.assertRaises(ValidationError):
+            config.model = "other"
+        self.assertEqual(hash(config), hash(ImageConfig()))
+
+    def test_model_copy(self):
+        config = ImageConfig(aspect_ratio="1:1")
+        copy = config.model_copy(update={"model": "gemini-2.5-flash-image"})
+        self.assertEqual(copy.model, "gemini-2.5-flash-image")
+        self.assertIs(copy.aspect_ratio, AspectRatio.SQUARE)
+        self.assertEqual(config.model, "gemini-3-pro-image-preview")
+        self.assertEqual(config.model_copy(deep=True), config)
+
+    def test_json_round_trip(self):
+        config = ImageConfig(aspect_ratio="3:2", response_modalities=["Image", "Text"])
+        self.assertEqual(ImageConfig.model_validate_json(config.model_dump_json()), config)
+
+
+class GenerationProfileConfigTest(unittest.TestCase):
+    def test_builds_config_from_mapping(self):
+        profile = GenerationProfile(
+            id="p", name="P", config={"aspect_ratio": "TALL", "image_size": "2K"}
+        )
+        self.assertIs(profile.config.aspect_ratio, AspectRatio.TALL)
+
+    def test_rejects_invalid_config(self):
+        with self.assertRaises(ValidationError):
+            GenerationProfile(id="p", name="P", config={"model": 123})
+
+
+if __name__ == "__main__":
+    unittest.main()
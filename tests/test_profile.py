@@ -0,0 +1,133 @@
+"""Tests for profile loading and caching."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from nanobanana.config import PROFILES_DIR
+from nanobanana.models.profile import GenerationProfile, list_profiles, load_profile
+
+
+def bump_mtime(path: Path) -> None:
+    """Move a path's mtime forward so coarse filesystem clocks can't hide a change."""
+    mtime_ns = os.stat(path).st_mtime_ns + 5_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class LoadProfileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name) / "profiles"
+        shutil.copytree(PROFILES_DIR, self.dir)
+        load_profile.cache_clear()
+        self.addCleanup(load_profile.cache_clear)
+
+    def test_returned_profiles_are_independent_copies(self):
+        profile = load_profile("cinematic", self.dir)
+        original = profile.style_prefix
+        profile.style_prefix = "changed"
+
+        self.assertEqual(load_profile("cinematic", self.dir).style_prefix, original)
+
+    def test_reparses_edited_profile(self):
+        self.assertEqual(load_profile("cinematic", self.dir).name, "Cinematic Wide")
+
+        path = self.dir / "cinematic.yaml"
+        path.write_text(path.read_text().replace("Cinematic Wide", "Edited"))
+        bump_mtime(path)
+
+        self.assertEqual(load_profile("cinematic", self.dir).name, "Edited")
+
+    def test_rescans_when_directory_changes(self):
+        self.assertNotIn("copy", list_profiles(self.dir))
+
+        shutil.copy(self.dir / "default.yaml", self.dir / "copy.yaml")
+        bump_mtime(self.dir)
+
+        self.assertIn("copy", list_profiles(self.dir))
+        self.assertEqual(load_profile("copy", self.dir).name, load_profile("default", self.dir).name)
+
+    def test_finds_new_profile_when_directory_mtime_is_unchanged(self):
+        list_profiles(self.dir)
+        dir_stat = os.stat(self.dir)
+
+        shutil.copy(self.dir / "default.yaml", self.dir / "copy.yaml")
+        # As on a filesystem whose timestamps are too coarse to show the add
+        os.utime(self.dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+        self.assertEqual(load_profile("copy", self.dir).id, "default")
+
+    def test_yaml_wins_over_yml(self):
+        yml = (self.dir / "cinematic.yaml").read_text().replace("Cinematic Wide", "From yml")
+        (self.dir / "cinematic.yml").write_text(yml)
+        (self.dir / "extra.yml").write_text(yml.replace("id: cinematic", "id: extra"))
+
+        self.assertEqual(load_profile("cinematic", self.dir).name, "Cinematic Wide")
+        self.assertEqual(load_profile("extra", self.dir).name, "From yml")
+        self.assertEqual(list_profiles(self.dir).count("cinematic"), 1)
+
+    def test_missing_profile(self):
+        with self.assertRaises(FileNotFoundError):
+            load_profile("nope", self.dir)
+
+
+class ProfileSidecarTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name) / "profiles"
+        shutil.copytree(PROFILES_DIR, self.dir)
+        self.yaml = self.dir / "cinematic.yaml"
+        self.sidecar = self.dir / ".cache" / "cinematic.yaml.json"
+
+        env = mock.patch.dict(os.environ, {"NANOBANANA_PROFILE_CACHE": "1"})
+        env.start()
+        self.addCleanup(env.stop)
+        load_profile.cache_clear()
+        self.addCleanup(load_profile.cache_clear)
+
+    def load_fresh(self) -> GenerationProfile:
+        """Load as a new process would, with no in-memory cache."""
+        load_profile.cache_clear()
+        return load_profile("cinematic", self.dir)
+
+    def test_writes_and_reuses_sidecar(self):
+        profile = self.load_fresh()
+        self.assertTrue(self.sidecar.exists())
+
+        with mock.patch.object(GenerationProfile, "from_yaml") as from_yaml:
+            self.assertEqual(self.load_fresh(), profile)
+        from_yaml.assert_not_called()
+
+    def test_sidecar_writes_leave_profiles_directory_unchanged(self):
+        (self.dir / ".cache").mkdir()
+        dir_mtime_ns = os.stat(self.dir).st_mtime_ns
+
+        self.load_fresh()
+
+        self.assertTrue(self.sidecar.exists())
+        self.assertEqual(os.stat(self.dir).st_mtime_ns, dir_mtime_ns)
+        self.assertNotIn(".cache", list_profiles(self.dir))
+
+    def test_stale_sidecar_is_rebuilt(self):
+        self.load_fresh()
+        self.yaml.write_text(self.yaml.read_text().replace("Cinematic Wide", "Edited"))
+        bump_mtime(self.yaml)
+
+        self.assertEqual(self.load_fresh().name, "Edited")
+        self.assertIn("Edited", self.sidecar.read_text())
+
+    def test_unreadable_sidecar_falls_back_to_yaml(self):
+        self.load_fresh()
+        self.sidecar.write_text("{not json")
+        bump_mtime(self.sidecar)
+
+        self.assertEqual(self.load_fresh().name, "Cinematic Wide")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""Tests for AdaptiveSemaphore and RPMLimiter."""
+
+import asyncio
+import time
+import unittest
+
+from nanobanana.rate_limit import AdaptiveSemaphore, RPMLimiter
+
+
+async def _settle():
+    """Let every ready task run until it blocks again."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class AdaptiveSemaphoreTest(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_blocks_at_cap_until_release(self):
+        sem = AdaptiveSemaphore(initial_value=2, min_value=1, max_value=4)
+        await sem.acquire()
+        await sem.acquire()
+
+        waiter = asyncio.create_task(sem.acquire())
+        await _settle()
+        self.assertFalse(waiter.done())
+
+        sem.release()
+        await _settle()
+        self.assertTrue(waiter.done())
+        self.assertEqual(sem._in_flight, 2)
+
+    async def test_waiters_are_served_in_order(self):
+        sem = AdaptiveSemaphore(initial_value=1, min_value=1, max_value=4)
+        order = []
+
+        async def worker(name):
+            async with sem:
+                order.append(name)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(worker(i) for i in range(5)))
+        self.assertEqual(order, list(range(5)))
+        self.assertEqual(sem._in_flight, 0)
+
+    async def test_increase_wakes_blocked_waiters(self):
+        sem = AdaptiveSemaphore(initial_value=1, min_value=1, max_value=4)
+        await sem.acquire()
+        waiters = [asyncio.create_task(sem.acquire()) for _ in range(3)]
+        await _settle()
+
+        await sem.increase_concurrency()
+        await _settle()
+        self.assertEqual([w.done() for w in waiters], [True, False, False])
+        self.assertEqual(sem.value, 2)
+
+        for _ in range(10):
+            await sem.report_success()
+        await _settle()
+        self.assertEqual([w.done() for w in waiters], [True, True, False])
+        self.assertEqual(sem.value, 3)
+
+        for w in waiters:
+            w.cancel()
+
+    async def test_decrease_holds_new_work_until_in_flight_drains(self):
+        sem = AdaptiveSemaphore(initial_value=4, min_value=2, max_value=4)
+        for _ in range(4):
+            await sem.acquire()
+
+        await sem.report_rate_limit()
+        self.assertEqual(sem.value, 2)
+
+        waiter = asyncio.create_task(sem.acquire())
+        sem.release()
+        sem.release()
+        await _settle()
+        self.assertFalse(waiter.done())
+
+        sem.release()
+        await _settle()
+        self.assertTrue(waiter.done())
+        self.assertEqual(sem._in_flight, 2)
+
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        sem = AdaptiveSemaphore(initial_value=1, min_value=1, max_value=2)
+        await sem.acquire()
+        cancelled = asyncio.create_task(sem.acquire())
+        waiting = asyncio.create_task(sem.acquire())
+        await _settle()
+
+        cancelled.cancel()
+        await _settle()
+        sem.release()
+        await _settle()
+
+        self.assertTrue(cancelled.cancelled())
+        self.assertTrue(waiting.done())
+        self.assertEqual(sem._in_flight, 1)
+
+    async def test_cancel_after_grant_passes_the_slot_on(self):
+        sem = AdaptiveSemaphore(initial_value=1, min_value=1, max_value=2)
+        await sem.acquire()
+        first = asyncio.create_task(sem.acquire())
+        second = asyncio.create_task(sem.acquire())
+        await _settle()
+
+        # Grant the slot to first, then cancel it before it resumes
+        sem.release()
+        first.cancel()
+        await _settle()
+
+        self.assertTrue(first.cancelled())
+        self.assertTrue(second.done())
+        self.assertEqual(sem._in_flight, 1)
+
+    async def test_context_exit_releases_when_body_is_cancelled(self):
+        sem = AdaptiveSemaphore(initial_value=1, min_value=1, max_value=2)
+
+        async def hold():
+            async with sem:
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(hold())
+        await _settle()
+        task.cancel()
+        await _settle()
+        self.assertEqual(sem._in_flight, 0)
+
+
+class RPMLimiterTest(unittest.IsolatedAsyncioTestCase):
+    async def drained(self, per_minute: int) -> RPMLimiter:
+        """A limiter whose bucket has just been emptied."""
+        limiter = RPMLimiter(max_per_minute=per_minute)
+        for _ in range(per_minute):
+            await limiter.acquire()
+        return limiter
+
+    async def test_full_bucket_does_not_wait(self):
+        limiter = RPMLimiter(max_per_minute=60)
+        start = time.monotonic()
+        for _ in range(60):
+            await limiter.acquire()
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    async def test_empty_bucket_sleeps_off_the_deficit(self):
+        limiter = await self.drained(600)  # refills at 10 tokens/s
+
+        start = time.monotonic()
+        await limiter.acquire()
+        await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # The second caller waits for two tokens' worth of refill
+        self.assertGreaterEqual(elapsed, 0.15)
+        self.assertLess(elapsed, 1.0)
+
+    async def test_available_is_never_negative(self):
+        limiter = await self.drained(600)
+        waiters = [asyncio.create_task(limiter.acquire()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        self.assertEqual(limiter.get_available(), 0.0)
+        self.assertEqual(limiter.capacity, 0.0)
+        for w in waiters:
+            w.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    async def test_cancelled_waiter_refunds_its_reservation(self):
+        limiter = await self.drained(60)  # refills at 1 token/s
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        self.assertAlmostEqual(limiter._tokens, -2.0, delta=0.1)
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        self.assertAlmostEqual(limiter._tokens, -1.0, delta=0.1)
+
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+
+
+class AdaptiveSemaphoreSyncTest(unittest.TestCase):
+    def test_release_without_running_loop(self):
+        sem = AdaptiveSemaphore(initial_value=2)
+        asyncio.run(sem.acquire())
+        sem.release()
+        self.assertEqual(sem._in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()